@@ -13,90 +13,271 @@ Usage:
 
 Requirements:
     pip install pandas matplotlib numpy
+    pip install pyarrow  # optional, multithreaded CSV parsing
+    pip install numba    # optional, parallel summary statistics for large files
 """
 
+import multiprocessing
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import matplotlib
+matplotlib.use('Agg')  # PNG output only; skips interactive backend selection and its imports
 import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
 from pathlib import Path
 
+# Bundled font (no system font fallback search) and no hinting pass on every text draw
+plt.rcParams['font.family'] = 'DejaVu Sans'
+plt.rcParams['text.hinting'] = 'none'
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa_csv = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# Only the columns the analysis touches, with their parse dtypes
+LATENCY_COLUMNS = {
+    'Timestamp': 'int64',
+    'Latency (ms)': 'float32',
+    'Chat ID': 'category',
+}
+
+# Same columns as Arrow types for the pyarrow reader; Chat ID is dictionary-encoded (-> category)
+if pa_csv is not None:
+    ARROW_COLUMN_TYPES = {
+        'Timestamp': pa.int64(),
+        'Latency (ms)': pa.float32(),
+        'Chat ID': pa.dictionary(pa.int32(), pa.string()),
+    }
+
+# Upper bound on raw points drawn in the time-series plot
+MAX_TIME_SERIES_POINTS = 20000
+
+# Distribution bars for the bucket report, one '█' per 2% (0-100%)
+BARS = ['█' * i for i in range(51)]
+
+def read_csv_arrow(filepath, columns):
+    """Parse the CSV with pyarrow's multithreaded reader and convert to pandas"""
+    convert_options = pa_csv.ConvertOptions(
+        include_columns=columns,
+        column_types={column: ARROW_COLUMN_TYPES[column] for column in columns},
+        strings_can_be_null=True
+    )
+    df = pa_csv.read_csv(filepath, convert_options=convert_options).to_pandas()
+    
+    # Arrow dictionaries keep first-seen order; sort them so chats are listed like a groupby would
+    if 'Chat ID' in df.columns:
+        df['Chat ID'] = df['Chat ID'].cat.reorder_categories(sorted(df['Chat ID'].cat.categories))
+    return df
+
 def load_latency_data(filepath):
     """Load latency data from CSV file"""
     try:
-        df = pd.read_csv(filepath)
+        header = pd.read_csv(filepath, nrows=0).columns
+        columns = [column for column in LATENCY_COLUMNS if column in header]
+        if pa_csv is not None:
+            df = read_csv_arrow(filepath, columns)
+        else:
+            df = pd.read_csv(
+                filepath,
+                usecols=columns,
+                dtype={column: LATENCY_COLUMNS[column] for column in columns}
+            )
+        # float32 is plenty for millisecond latencies and halves the bytes every sort/bin pass touches
+        df['Latency (ms)'] = df['Latency (ms)'].astype('float32', copy=False)
         return df
     except Exception as e:
         print(f"❌ Error loading {filepath}: {e}")
         return None
 
-def print_statistics(df, name):
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _scalar_stats(arr):
+        """One parallel pass: per-chunk mean/M2/min/max, merged with Chan's formula"""
+        n = arr.shape[0]
+        chunk = 65536
+        n_chunks = (n + chunk - 1) // chunk
+        counts = np.zeros(n_chunks)
+        means = np.zeros(n_chunks)
+        m2s = np.zeros(n_chunks)
+        mins = np.empty(n_chunks)
+        maxs = np.empty(n_chunks)
+        
+        for c in prange(n_chunks):
+            start = c * chunk
+            stop = min(start + chunk, n)
+            mean = 0.0
+            m2 = 0.0
+            mn = np.inf
+            mx = -np.inf
+            for i in range(start, stop):
+                x = np.float64(arr[i])
+                k = i - start + 1
+                delta = x - mean
+                mean += delta / k
+                m2 += delta * (x - mean)
+                mn = min(mn, x)
+                mx = max(mx, x)
+            counts[c] = stop - start
+            means[c] = mean
+            m2s[c] = m2
+            mins[c] = mn
+            maxs[c] = mx
+        
+        count = 0.0
+        mean = 0.0
+        m2 = 0.0
+        for c in range(n_chunks):
+            total = count + counts[c]
+            delta = means[c] - mean
+            mean += delta * counts[c] / total
+            m2 += m2s[c] + delta * delta * count * counts[c] / total
+            count = total
+        return mean, m2, mins.min(), maxs.max()
+else:
+    def _scalar_stats(arr):
+        """NumPy fallback for the Numba kernel: (mean, M2, min, max)"""
+        mean = arr.mean(dtype=np.float64)
+        m2 = np.square(arr - mean, dtype=np.float64).sum()
+        return mean, m2, arr.min(), arr.max()
+
+def interpolated_percentiles(values, quantiles):
+    """Linearly interpolated quantiles (same as pandas' default) via a partial sort"""
+    positions = (len(values) - 1) * np.asarray(quantiles, dtype=np.float64)
+    lower = np.floor(positions).astype(np.int64)
+    upper = np.minimum(lower + 1, len(values) - 1)
+    fraction = positions - lower
+    
+    # Only the neighbouring ranks of each quantile need to land in place
+    partitioned = np.partition(values, np.unique(np.concatenate([lower, upper])))
+    lower_values = partitioned[lower].astype(np.float64)
+    return lower_values + (partitioned[upper] - lower_values) * fraction
+
+def sorted_latencies(stats):
+    """Fully sorted latencies, computed on first use and cached in the stats dict"""
+    if 'sorted' not in stats:
+        stats['sorted'] = np.sort(stats['arr'])
+    return stats['sorted']
+
+def summarize(df):
+    """Compute latency summary statistics once so every report and plot can reuse them"""
+    latencies = df['Latency (ms)'].to_numpy(dtype=np.float32, copy=False)
+    n = len(latencies)
+    
+    mean, m2, min_latency, max_latency = _scalar_stats(latencies)
+    p50, p75, p90, p95, p99 = interpolated_percentiles(latencies, [0.50, 0.75, 0.90, 0.95, 0.99])
+    
+    return {
+        'arr': latencies,
+        'n': n,
+        'mean': mean,
+        'std': np.sqrt(m2 / (n - 1)) if n > 1 else np.nan,
+        'median': p50,
+        'p50': p50,
+        'p75': p75,
+        'p90': p90,
+        'p95': p95,
+        'p99': p99,
+        'min': min_latency,
+        'max': max_latency,
+    }
+
+def print_statistics(stats, name):
     """Print statistical summary of latency data"""
     print(f"\n{'='*70}")
     print(f"📊 {name} - Statistical Summary")
     print(f"{'='*70}")
     
-    latencies = df['Latency (ms)']
-    
-    print(f"Count:      {len(latencies)}")
-    print(f"Mean:       {latencies.mean():.2f} ms")
-    print(f"Median:     {latencies.median():.2f} ms")
-    print(f"Std Dev:    {latencies.std():.2f} ms")
-    print(f"Min:        {latencies.min():.2f} ms")
-    print(f"Max:        {latencies.max():.2f} ms")
+    print(f"Count:      {stats['n']}")
+    print(f"Mean:       {stats['mean']:.2f} ms")
+    print(f"Median:     {stats['median']:.2f} ms")
+    print(f"Std Dev:    {stats['std']:.2f} ms")
+    print(f"Min:        {stats['min']:.2f} ms")
+    print(f"Max:        {stats['max']:.2f} ms")
     print(f"\nPercentiles:")
-    print(f"  P50:      {latencies.quantile(0.50):.2f} ms")
-    print(f"  P75:      {latencies.quantile(0.75):.2f} ms")
-    print(f"  P90:      {latencies.quantile(0.90):.2f} ms")
-    print(f"  P95:      {latencies.quantile(0.95):.2f} ms")
-    print(f"  P99:      {latencies.quantile(0.99):.2f} ms")
+    print(f"  P50:      {stats['p50']:.2f} ms")
+    print(f"  P75:      {stats['p75']:.2f} ms")
+    print(f"  P90:      {stats['p90']:.2f} ms")
+    print(f"  P95:      {stats['p95']:.2f} ms")
+    print(f"  P99:      {stats['p99']:.2f} ms")
     
     # Latency buckets
     print(f"\nLatency Distribution:")
-    buckets = [
-        (0, 100, "< 100ms"),
-        (100, 200, "100-200ms"),
-        (200, 500, "200-500ms"),
-        (500, 1000, "500-1000ms"),
-        (1000, float('inf'), "> 1000ms")
-    ]
-    
-    for min_lat, max_lat, label in buckets:
-        count = len(latencies[(latencies >= min_lat) & (latencies < max_lat)])
-        percentage = (count / len(latencies)) * 100
-        bar = '█' * int(percentage / 2)
+    bucket_edges = np.array([0, 100, 200, 500, 1000, np.inf])
+    bucket_labels = ["< 100ms", "100-200ms", "200-500ms", "500-1000ms", "> 1000ms"]
+    
+    # [min_lat, max_lat) per bucket: binary search over the 6 edges, so the report never sorts N values
+    bucket_index = np.searchsorted(bucket_edges, stats['arr'], side='right')
+    bucket_counts = np.bincount(bucket_index, minlength=len(bucket_edges) + 1)[1:len(bucket_edges)]
+    
+    for label, count in zip(bucket_labels, bucket_counts):
+        percentage = (count / stats['n']) * 100
+        bar = BARS[min(50, int(percentage / 2))]
         print(f"  {label:12s}: {count:5d} ({percentage:5.1f}%) {bar}")
 
-def plot_histogram(df, name, filename, color='blue'):
+_reusable_axes = None
+
+def reusable_axes():
+    """Per-process axes reused (and cleared) by every single-axes plot rendered in that process"""
+    global _reusable_axes
+    if _reusable_axes is None:
+        _, _reusable_axes = plt.subplots(figsize=(12, 6), layout='constrained')
+    return _reusable_axes
+
+def render_single_axes_plot(plot_function, *args, **kwargs):
+    """Pool task: draw a single-axes plot on this worker's reusable axes"""
+    plot_function(*args, ax=reusable_axes(), **kwargs)
+
+def prepare_axes(ax, figsize):
+    """Clear a reused axes, or create a standalone figure when none is given"""
+    if ax is None:
+        _, ax = plt.subplots(figsize=figsize, layout='constrained')
+        return ax, True
+    ax.clear()
+    # clear() keeps tick parameters, so undo the chat plot's label rotation
+    ax.tick_params(axis='x', labelrotation=0)
+    return ax, False
+
+def plot_histogram(stats, name, filename, color='blue', ax=None):
     """Plot latency histogram"""
-    plt.figure(figsize=(10, 6))
-    
-    latencies = df['Latency (ms)']
-    
-    plt.hist(latencies, bins=50, alpha=0.7, color=color, edgecolor='black')
-    plt.axvline(latencies.mean(), color='red', linestyle='--', linewidth=2, label=f'Mean: {latencies.mean():.2f}ms')
-    plt.axvline(latencies.median(), color='green', linestyle='--', linewidth=2, label=f'Median: {latencies.median():.2f}ms')
-    plt.axvline(latencies.quantile(0.95), color='orange', linestyle='--', linewidth=2, label=f'P95: {latencies.quantile(0.95):.2f}ms')
-    
-    plt.xlabel('Latency (ms)', fontsize=12)
-    plt.ylabel('Frequency', fontsize=12)
-    plt.title(f'{name} - Latency Distribution', fontsize=14, fontweight='bold')
-    plt.legend()
-    plt.grid(True, alpha=0.3)
-    
-    plt.tight_layout()
-    plt.savefig(filename, dpi=300)
-    print(f"📁 Saved histogram: {filename}")
-    plt.close()
+    ax, owns_figure = prepare_axes(ax, figsize=(10, 6))
+    
+    counts, edges = np.histogram(stats['arr'], bins=50)
+    ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge', alpha=0.7, color=color, edgecolor='black')
+    ax.axvline(stats['mean'], color='red', linestyle='--', linewidth=2, label=f"Mean: {stats['mean']:.2f}ms")
+    ax.axvline(stats['median'], color='green', linestyle='--', linewidth=2, label=f"Median: {stats['median']:.2f}ms")
+    ax.axvline(stats['p95'], color='orange', linestyle='--', linewidth=2, label=f"P95: {stats['p95']:.2f}ms")
+    
+    ax.set_xlabel('Latency (ms)', fontsize=12)
+    ax.set_ylabel('Frequency', fontsize=12)
+    ax.set_title(f'{name} - Latency Distribution', fontsize=14, fontweight='bold')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    
+    ax.figure.savefig(filename, dpi=150)
+    print(f"📁 Saved histogram: {filename}", flush=True)
+    if owns_figure:
+        plt.close(ax.figure)
 
-def plot_comparison(a2p_df, p2p_df, filename):
+def plot_comparison(a2p_stats, p2p_stats, filename):
     """Plot A2P vs P2P comparison"""
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    fig, axes = plt.subplots(2, 2, figsize=(14, 10), layout='constrained')
     
-    # 1. Histogram comparison
+    # 1. Histogram comparison (shared bin edges so the two distributions line up)
     ax1 = axes[0, 0]
-    ax1.hist(a2p_df['Latency (ms)'], bins=50, alpha=0.5, label='A2P', color='blue', edgecolor='black')
-    ax1.hist(p2p_df['Latency (ms)'], bins=50, alpha=0.5, label='P2P', color='orange', edgecolor='black')
+    edges = np.linspace(min(a2p_stats['min'], p2p_stats['min']), max(a2p_stats['max'], p2p_stats['max']), 51)
+    a2p_counts, _ = np.histogram(a2p_stats['arr'], bins=edges)
+    p2p_counts, _ = np.histogram(p2p_stats['arr'], bins=edges)
+    ax1.stairs(a2p_counts, edges, fill=True, alpha=0.5, label='A2P', color='blue')
+    ax1.stairs(p2p_counts, edges, fill=True, alpha=0.5, label='P2P', color='orange')
     ax1.set_xlabel('Latency (ms)')
     ax1.set_ylabel('Frequency')
     ax1.set_title('Latency Distribution Comparison')
@@ -106,7 +287,7 @@ def plot_comparison(a2p_df, p2p_df, filename):
     # 2. Box plot comparison
     ax2 = axes[0, 1]
     ax2.boxplot(
-        [a2p_df['Latency (ms)'], p2p_df['Latency (ms)']],
+        [a2p_stats['arr'], p2p_stats['arr']],
         labels=['A2P', 'P2P'],
         patch_artist=True,
         boxprops=dict(facecolor='lightblue', alpha=0.7),
@@ -119,13 +300,11 @@ def plot_comparison(a2p_df, p2p_df, filename):
     # 3. CDF (Cumulative Distribution Function)
     ax3 = axes[1, 0]
     
-    a2p_sorted = np.sort(a2p_df['Latency (ms)'])
-    a2p_cdf = np.arange(1, len(a2p_sorted) + 1) / len(a2p_sorted)
-    ax3.plot(a2p_sorted, a2p_cdf * 100, label='A2P', color='blue', linewidth=2)
+    a2p_percentiles = np.linspace(100.0 / a2p_stats['n'], 100.0, a2p_stats['n'], dtype=np.float32)
+    ax3.plot(sorted_latencies(a2p_stats), a2p_percentiles, label='A2P', color='blue', linewidth=2)
     
-    p2p_sorted = np.sort(p2p_df['Latency (ms)'])
-    p2p_cdf = np.arange(1, len(p2p_sorted) + 1) / len(p2p_sorted)
-    ax3.plot(p2p_sorted, p2p_cdf * 100, label='P2P', color='orange', linewidth=2)
+    p2p_percentiles = np.linspace(100.0 / p2p_stats['n'], 100.0, p2p_stats['n'], dtype=np.float32)
+    ax3.plot(sorted_latencies(p2p_stats), p2p_percentiles, label='P2P', color='orange', linewidth=2)
     
     ax3.axhline(95, color='red', linestyle='--', alpha=0.5, label='P95')
     ax3.axhline(99, color='darkred', linestyle='--', alpha=0.5, label='P99')
@@ -140,18 +319,8 @@ def plot_comparison(a2p_df, p2p_df, filename):
     ax4 = axes[1, 1]
     
     metrics = ['Mean', 'Median', 'P95', 'P99']
-    a2p_values = [
-        a2p_df['Latency (ms)'].mean(),
-        a2p_df['Latency (ms)'].median(),
-        a2p_df['Latency (ms)'].quantile(0.95),
-        a2p_df['Latency (ms)'].quantile(0.99)
-    ]
-    p2p_values = [
-        p2p_df['Latency (ms)'].mean(),
-        p2p_df['Latency (ms)'].median(),
-        p2p_df['Latency (ms)'].quantile(0.95),
-        p2p_df['Latency (ms)'].quantile(0.99)
-    ]
+    a2p_values = [a2p_stats['mean'], a2p_stats['median'], a2p_stats['p95'], a2p_stats['p99']]
+    p2p_values = [p2p_stats['mean'], p2p_stats['median'], p2p_stats['p95'], p2p_stats['p99']]
     
     x = np.arange(len(metrics))
     width = 0.35
@@ -167,72 +336,109 @@ def plot_comparison(a2p_df, p2p_df, filename):
     ax4.legend()
     ax4.grid(True, alpha=0.3, axis='y')
     
-    plt.tight_layout()
-    plt.savefig(filename, dpi=300)
-    print(f"📁 Saved comparison chart: {filename}")
-    plt.close()
+    fig.savefig(filename, dpi=150)
+    print(f"📁 Saved comparison chart: {filename}", flush=True)
+    plt.close(fig)
 
-def plot_time_series(df, name, filename, color='blue'):
+def plot_time_series(timestamps, latencies, name, filename, color='blue', ax=None):
     """Plot latency over time"""
-    plt.figure(figsize=(12, 6))
+    ax, owns_figure = prepare_axes(ax, figsize=(12, 6))
     
-    # Sort by timestamp
-    df_sorted = df.sort_values('Timestamp')
+    # Sort by timestamp on the raw arrays
+    order = np.argsort(timestamps, kind='stable')
+    timestamps = timestamps[order]
+    latencies = latencies[order]
     
     # Calculate relative time (seconds from start)
-    start_time = df_sorted['Timestamp'].min()
-    df_sorted['Relative Time (s)'] = (df_sorted['Timestamp'] - start_time) / 1000
+    relative_time = (timestamps - timestamps[0]) * 1e-3
+    
+    # Evenly downsample the raw points; the moving average below still uses every message
+    point_time, point_latencies = relative_time, latencies
+    if len(latencies) > MAX_TIME_SERIES_POINTS:
+        idx = np.linspace(0, len(latencies) - 1, MAX_TIME_SERIES_POINTS).astype(np.int64)
+        point_time, point_latencies = relative_time[idx], latencies[idx]
     
-    plt.scatter(df_sorted['Relative Time (s)'], df_sorted['Latency (ms)'], 
-                alpha=0.3, s=10, color=color)
+    ax.plot(point_time, point_latencies, linestyle='', marker='o', markersize=3,
+            markeredgewidth=0, alpha=0.3, color=color, rasterized=True)
     
     # Add moving average
     window = 50
-    if len(df_sorted) >= window:
-        moving_avg = df_sorted['Latency (ms)'].rolling(window=window).mean()
-        plt.plot(df_sorted['Relative Time (s)'], moving_avg, 
-                color='red', linewidth=2, label=f'{window}-message Moving Average')
-    
-    plt.xlabel('Time (seconds)', fontsize=12)
-    plt.ylabel('Latency (ms)', fontsize=12)
-    plt.title(f'{name} - Latency Over Time', fontsize=14, fontweight='bold')
-    plt.legend()
-    plt.grid(True, alpha=0.3)
-    
-    plt.tight_layout()
-    plt.savefig(filename, dpi=300)
-    print(f"📁 Saved time series plot: {filename}")
-    plt.close()
+    if len(latencies) >= window:
+        # O(N) trailing mean from a cumulative sum; first value lands on message `window`
+        cumulative = np.cumsum(np.insert(latencies.astype(np.float64), 0, 0.0))
+        moving_avg = (cumulative[window:] - cumulative[:-window]) / window
+        ax.plot(relative_time[window - 1:], moving_avg, 
+               color='red', linewidth=2, label=f'{window}-message Moving Average')
+    
+    ax.set_xlabel('Time (seconds)', fontsize=12)
+    ax.set_ylabel('Latency (ms)', fontsize=12)
+    ax.set_title(f'{name} - Latency Over Time', fontsize=14, fontweight='bold')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    
+    ax.figure.savefig(filename, dpi=150)
+    print(f"📁 Saved time series plot: {filename}", flush=True)
+    if owns_figure:
+        plt.close(ax.figure)
 
-def plot_chat_distribution(df, name, filename):
+def chat_box_stats(chat_ids, latencies):
+    """Per-chat box plot statistics (as ax.bxp expects) from a single (chat, latency) sort"""
+    codes, chats = pd.factorize(chat_ids, sort=True)
+    
+    # Rows without a chat ID get code -1; leave them out like groupby does
+    has_chat = codes >= 0
+    codes, latencies = codes[has_chat], latencies[has_chat]
+    
+    # Sorted by chat, then latency: every chat is a contiguous, already-sorted slice
+    order = np.lexsort((latencies, codes))
+    latencies = latencies[order]
+    bounds = np.searchsorted(codes[order], np.arange(len(chats) + 1))
+    starts, counts = bounds[:-1], np.diff(bounds)
+    
+    # Quartiles for all chats at once by indexing, linearly interpolated like matplotlib's boxplot
+    positions = (counts[:, None] - 1) * np.array([0.25, 0.5, 0.75])
+    lower = np.floor(positions).astype(np.int64)
+    upper = np.minimum(lower + 1, counts[:, None] - 1)
+    lower_values = latencies[starts[:, None] + lower].astype(np.float64)
+    q1, median, q3 = (lower_values + (latencies[starts[:, None] + upper] - lower_values) * (positions - lower)).T
+    
+    # Whiskers reach the furthest points within 1.5 IQR; everything beyond is a flier
+    iqr = q3 - q1
+    box_stats = []
+    for g, chat in enumerate(chats):
+        chat_latencies = latencies[starts[g]:bounds[g + 1]]
+        lo = np.searchsorted(chat_latencies, q1[g] - 1.5 * iqr[g], side='left')
+        hi = np.searchsorted(chat_latencies, q3[g] + 1.5 * iqr[g], side='right') - 1
+        box_stats.append({
+            'label': str(chat),
+            'q1': q1[g],
+            'med': median[g],
+            'q3': q3[g],
+            # Clamp to the box like cbook.boxplot_stats when no point lies between the fence and the quartile
+            'whislo': min(chat_latencies[lo], q1[g]),
+            'whishi': max(chat_latencies[hi], q3[g]),
+            'fliers': np.concatenate([chat_latencies[:lo], chat_latencies[hi + 1:]]),
+        })
+    return box_stats
+
+def plot_chat_distribution(chat_ids, latencies, name, filename, ax=None):
     """Plot latency distribution by chat"""
-    plt.figure(figsize=(12, 6))
-    
-    # Group by chat ID
-    chat_groups = df.groupby('Chat ID')['Latency (ms)']
-    
-    # Create box plot
-    chat_ids = []
-    latencies_by_chat = []
-    
-    for chat_id, latencies in chat_groups:
-        chat_ids.append(str(chat_id))
-        latencies_by_chat.append(latencies.values)
-    
-    plt.boxplot(latencies_by_chat, labels=chat_ids, patch_artist=True,
-                boxprops=dict(facecolor='lightblue', alpha=0.7),
-                medianprops=dict(color='red', linewidth=2))
-    
-    plt.xlabel('Chat ID', fontsize=12)
-    plt.ylabel('Latency (ms)', fontsize=12)
-    plt.title(f'{name} - Latency Distribution by Chat', fontsize=14, fontweight='bold')
-    plt.grid(True, alpha=0.3, axis='y')
-    plt.xticks(rotation=45)
-    
-    plt.tight_layout()
-    plt.savefig(filename, dpi=300)
-    print(f"📁 Saved chat distribution: {filename}")
-    plt.close()
+    ax, owns_figure = prepare_axes(ax, figsize=(12, 6))
+    
+    ax.bxp(chat_box_stats(chat_ids, latencies), patch_artist=True,
+           boxprops=dict(facecolor='lightblue', alpha=0.7),
+           medianprops=dict(color='red', linewidth=2))
+    
+    ax.set_xlabel('Chat ID', fontsize=12)
+    ax.set_ylabel('Latency (ms)', fontsize=12)
+    ax.set_title(f'{name} - Latency Distribution by Chat', fontsize=14, fontweight='bold')
+    ax.grid(True, alpha=0.3, axis='y')
+    ax.tick_params(axis='x', labelrotation=45)
+    
+    ax.figure.savefig(filename, dpi=150)
+    print(f"📁 Saved chat distribution: {filename}", flush=True)
+    if owns_figure:
+        plt.close(ax.figure)
 
 def main():
     if len(sys.argv) < 2:
@@ -252,33 +458,26 @@ def main():
     if a2p_df is None:
         sys.exit(1)
     
-    print_statistics(a2p_df, "A2P (HTTP)")
-    plot_histogram(a2p_df, "A2P (HTTP)", "a2p_histogram.png", color='blue')
-    plot_time_series(a2p_df, "A2P (HTTP)", "a2p_timeseries.png", color='blue')
-    
-    if 'Chat ID' in a2p_df.columns:
-        plot_chat_distribution(a2p_df, "A2P (HTTP)", "a2p_chat_distribution.png")
+    a2p_stats = summarize(a2p_df)
+    print_statistics(a2p_stats, "A2P (HTTP)")
     
     # Load P2P data if provided
+    p2p_df = None
     if len(sys.argv) > 2:
         p2p_file = sys.argv[2]
         p2p_df = load_latency_data(p2p_file)
         
         if p2p_df is not None:
-            print_statistics(p2p_df, "P2P (WebSocket)")
-            plot_histogram(p2p_df, "P2P (WebSocket)", "p2p_histogram.png", color='orange')
-            plot_time_series(p2p_df, "P2P (WebSocket)", "p2p_timeseries.png", color='orange')
-            
-            if 'Chat ID' in p2p_df.columns:
-                plot_chat_distribution(p2p_df, "P2P (WebSocket)", "p2p_chat_distribution.png")
+            p2p_stats = summarize(p2p_df)
+            print_statistics(p2p_stats, "P2P (WebSocket)")
             
             # Comparison
             print("\n" + "="*70)
             print("🔬 Comparison Analysis")
             print("="*70)
             
-            a2p_mean = a2p_df['Latency (ms)'].mean()
-            p2p_mean = p2p_df['Latency (ms)'].mean()
+            a2p_mean = a2p_stats['mean']
+            p2p_mean = p2p_stats['mean']
             
             difference = abs(a2p_mean - p2p_mean)
             percentage = (difference / max(a2p_mean, p2p_mean)) * 100
@@ -287,8 +486,33 @@ def main():
                 print(f"🏆 A2P is faster by {difference:.2f}ms ({percentage:.1f}%)")
             else:
                 print(f"🏆 P2P is faster by {difference:.2f}ms ({percentage:.1f}%)")
-            
-            plot_comparison(a2p_df, p2p_df, "comparison.png")
+    
+    # Every plot is an independent render + PNG encode, so render them in parallel.
+    # Arguments are plain arrays/dicts so they pickle cheaply to the workers. Workers are
+    # spawned, not forked: forking after Numba/Arrow thread pools have started can hang.
+    print()
+    with ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=multiprocessing.get_context('spawn')) as executor:
+        futures = [
+            executor.submit(render_single_axes_plot, plot_histogram, a2p_stats, "A2P (HTTP)", "a2p_histogram.png", color='blue'),
+            executor.submit(render_single_axes_plot, plot_time_series, a2p_df['Timestamp'].to_numpy(), a2p_stats['arr'],
+                            "A2P (HTTP)", "a2p_timeseries.png", color='blue'),
+        ]
+        if 'Chat ID' in a2p_df.columns:
+            futures.append(executor.submit(render_single_axes_plot, plot_chat_distribution, a2p_df['Chat ID'].array, a2p_stats['arr'],
+                                           "A2P (HTTP)", "a2p_chat_distribution.png"))
+        
+        if p2p_df is not None:
+            futures.append(executor.submit(render_single_axes_plot, plot_histogram, p2p_stats, "P2P (WebSocket)", "p2p_histogram.png", color='orange'))
+            futures.append(executor.submit(render_single_axes_plot, plot_time_series, p2p_df['Timestamp'].to_numpy(), p2p_stats['arr'],
+                                           "P2P (WebSocket)", "p2p_timeseries.png", color='orange'))
+            if 'Chat ID' in p2p_df.columns:
+                futures.append(executor.submit(render_single_axes_plot, plot_chat_distribution, p2p_df['Chat ID'].array, p2p_stats['arr'],
+                                               "P2P (WebSocket)", "p2p_chat_distribution.png"))
+            futures.append(executor.submit(plot_comparison, a2p_stats, p2p_stats, "comparison.png"))
+        
+        # Surface any worker exception
+        for future in as_completed(futures):
+            future.result()
     
     print("\n" + "="*70)
     print("✅ Analysis complete!")